@@ -1,7 +1,7 @@
 """
 AI Logger — Python SDK
 
-Zero-dependency SDK (uses only the standard library urllib).
+Zero-dependency SDK (uses only the standard library http.client).
 
 Usage:
     from ai_logger import AILogger
@@ -1,17 +1,22 @@
 """
 AILogger client — core implementation.
-Uses only Python standard library (urllib, json).
+Uses only Python standard library (http.client, json).
 Compatible with Python 3.7+.
 """
 
+import http.client
 import json
-import urllib.request
-import urllib.error
-from typing import Any, Dict, Optional
+import logging
+import ssl
+import threading
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
 
 DEFAULT_BASE_URL = "https://api.ailogger.io"
 DEFAULT_TIMEOUT  = 10  # seconds
 
+_logger = logging.getLogger("ai_logger")
+
 
 class AILoggerError(Exception):
     """Raised when the AI Logger API returns an error."""
@@ -21,6 +26,80 @@ class AILoggerError(Exception):
         self.status_code = status_code
 
 
+class _HostConnectionPool:
+    """
+    Keeps one persistent keep-alive connection per (scheme, host, port).
+
+    Requests on the same connection are serialized with a lock; a pooled
+    connection the server has closed is re-opened once before giving up.
+    The TLS context (and its CA bundle) is loaded once, not per connection.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._conns: Dict[Tuple[str, str, int], http.client.HTTPConnection] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+    ) -> Tuple[int, str, bytes]:
+        key = (scheme, host, port)
+        with self._lock:
+            reused = key in self._conns
+            try:
+                return self._send(key, method, path, body, headers)
+            except (http.client.RemoteDisconnected, BrokenPipeError):
+                # Only a reused connection the server closed while idle is
+                # retried; anything else may have reached the server already.
+                if not reused:
+                    raise
+                return self._send(key, method, path, body, headers)
+
+    def close(self) -> None:
+        with self._lock:
+            for key in list(self._conns):
+                self._drop(key)
+
+    def _send(
+        self,
+        key: Tuple[str, str, int],
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+    ) -> Tuple[int, str, bytes]:
+        conn = self._conns.get(key)
+        if conn is None:
+            scheme, host, port = key
+            if scheme == "https":
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                conn = http.client.HTTPSConnection(host, port, timeout=self._timeout, context=self._ssl_context)
+            else:
+                conn = http.client.HTTPConnection(host, port, timeout=self._timeout)
+            self._conns[key] = conn
+        try:
+            conn.request(method, path, body, headers)
+            resp = conn.getresponse()
+            return resp.status, resp.getheader("Content-Type", ""), resp.read()
+        except Exception:
+            self._drop(key)
+            raise
+
+    def _drop(self, key: Tuple[str, str, int]) -> None:
+        conn = self._conns.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+
 class AILogger:
     """
     AI Logger client.
@@ -46,6 +125,22 @@ class AILogger:
         self._base_url = base_url.rstrip("/")
         self._timeout  = timeout
         self._silent   = silent
+        self._failures = 0
+
+        url = urllib.parse.urlsplit(self._base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"[AILogger] Invalid base_url: {base_url!r}")
+        self._scheme      = url.scheme
+        self._host        = url.hostname
+        self._port        = url.port or (443 if url.scheme == "https" else 80)
+        self._log_path    = url.path + "/log"
+        self._pool        = _HostConnectionPool(timeout)
+        self._headers     = {
+            "Content-Type":  "application/json",
+            "Connection":    "keep-alive",
+            "x-api-key":     self._api_key,
+            "User-Agent":    "ai-logger-python-sdk/1.0.0",
+        }
 
     def log(
         self,
@@ -92,42 +187,46 @@ class AILogger:
         if metadata   is not None: payload["metadata"]  = metadata
 
         try:
-            return self._request("POST", "/log", payload)
+            result = self._request("POST", self._log_path, payload)
         except AILoggerError:
             raise
         except Exception as exc:
-            if not self._silent:
-                import warnings
-                warnings.warn(f"[AILogger] Failed to log interaction: {exc}", stacklevel=2)
+            # Only report the 1st, 2nd, 4th, 8th... consecutive unexpected failure.
+            self._failures += 1
+            failures = self._failures
+            if not self._silent and failures & (failures - 1) == 0:
+                _logger.warning("[AILogger] Failed to log interaction (failure #%d): %s", failures, exc)
             raise AILoggerError(str(exc)) from exc
 
+        self._failures = 0
+        return result
+
+    def close(self) -> None:
+        """Close the underlying keep-alive connection."""
+        self._pool.close()
+
     # ── Internal helpers ──────────────────────────────────────────────────────
 
     def _request(self, method: str, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
-        url  = self._base_url + path
         data = json.dumps(body).encode("utf-8")
-
-        req = urllib.request.Request(
-            url,
-            data=data,
-            method=method,
-            headers={
-                "Content-Type":  "application/json",
-                "x-api-key":     self._api_key,
-                "User-Agent":    "ai-logger-python-sdk/1.0.0",
-            },
-        )
-
         try:
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                raw = resp.read().decode("utf-8")
-                return json.loads(raw)
-        except urllib.error.HTTPError as exc:
-            raw = exc.read().decode("utf-8")
-            try:
-                detail = json.loads(raw).get("error", raw)
-            except Exception:
-                detail = raw
-            raise AILoggerError(detail, status_code=exc.code) from exc
-        except urllib.error.URLError as exc:
-            raise AILoggerError(f"Network error: {exc.reason}") from exc
+            status, content_type, raw_bytes = self._pool.request(
+                self._scheme, self._host, self._port,
+                method, path, data, self._headers,
+            )
+        except (OSError, http.client.HTTPException) as exc:
+            raise AILoggerError(f"Network error: {exc}") from exc
+
+        is_json = content_type.startswith("application/json")
+        if status >= 400:
+            detail = raw_bytes.decode("utf-8", "replace")
+            if is_json:
+                try:
+                    detail = json.loads(raw_bytes).get("error", detail)
+                except Exception:
+                    pass
+            raise AILoggerError(detail, status_code=status)
+        # Skip parsing empty or non-JSON bodies.
+        if not raw_bytes or not is_json:
+            return {}
+        return json.loads(raw_bytes)
@@ -2,26 +2,139 @@
 RegulateAI client — core implementation.
 EU AI Act Compliance Logging Platform.
 
-Uses only Python standard library (urllib, json, threading).
+Uses only Python standard library (http.client, json, threading).
 Compatible with Python 3.8+.
 """
 
+import collections
+import gzip
+import http.client
+import itertools
 import json
-import urllib.request
-import urllib.error
+import logging
+import operator
+import ssl
 import threading
 import time
-from typing import Any, Callable, Dict, Optional, TypeVar
-from datetime import datetime
+import urllib.parse
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
 
 DEFAULT_BASE_URL = "https://api.regulateai.io"
 DEFAULT_TIMEOUT = 10  # seconds
 DEFAULT_BUFFER_SIZE = 50
+MAX_BATCH_SIZE = 100  # the ingest API rejects larger batches
+DEFAULT_MAX_BUFFER_SIZE = MAX_BATCH_SIZE
+MIN_BUFFER_SIZE = 10
+DEFAULT_MAX_BUFFERED = 10_000
+GROW_AFTER_FLUSHES = 4  # consecutive fast, full flushes before the batch size grows
 DEFAULT_FLUSH_INTERVAL = 5  # seconds
+COMPRESS_MIN_BYTES = 1024  # smaller batch bodies are sent uncompressed
+
+_logger = logging.getLogger("regulateai")
+
+_NETWORK_ERRORS: Tuple[type, ...] = (OSError, http.client.HTTPException)
 
 T = TypeVar('T')
 
 
+_encode_str = json.encoder.encode_basestring_ascii  # C implementation when available
+
+
+def _json_value(value: Any) -> str:
+    """Encode one JSON value, with fast paths for str, int and finite float."""
+    kind = type(value)
+    if kind is str:
+        return _encode_str(value)
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float and value - value == 0:  # finite
+        return float.__repr__(value)
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _encode_log(
+    prompt: str,
+    output: str,
+    model: str,
+    model_version: Optional[str],
+    confidence: Optional[float],
+    latency_ms: Optional[int],
+    tokens_input: Optional[int],
+    tokens_output: Optional[int],
+    user_identifier: Optional[str],
+    session_id: Optional[str],
+    framework: Optional[str],
+    metadata: Optional[Dict[str, Any]],
+) -> bytes:
+    """
+    Encode one ingest log entry as compact, ASCII-only JSON.
+
+    Specialized for the fixed ingest schema: keys are literals and only the
+    values go through an encoder, which is several times faster than
+    building a dict and passing it to ``json.dumps``.
+    """
+    parts = ['{"prompt":', _encode_str(prompt), ',"output":', _encode_str(output), ',"model":', _encode_str(model)]
+    if model_version is not None:
+        parts += (',"modelVersion":', _json_value(model_version))
+    if confidence is not None:
+        parts += (',"confidence":', _json_value(confidence))
+    if latency_ms is not None:
+        parts += (',"latencyMs":', _json_value(latency_ms))
+    if tokens_input is not None:
+        parts += (',"tokensInput":', _json_value(tokens_input))
+    if tokens_output is not None:
+        parts += (',"tokensOutput":', _json_value(tokens_output))
+    if user_identifier is not None:
+        parts += (',"userIdentifier":', _json_value(user_identifier))
+    if session_id is not None:
+        parts += (',"sessionId":', _json_value(session_id))
+    if framework is not None:
+        parts += (',"framework":', _json_value(framework))
+    if metadata is not None:
+        parts += (',"metadata":', _json_value(metadata))
+    parts.append("}")
+    # ASCII escapes keep lone surrogates (e.g. truncated emoji) encodable.
+    return "".join(parts).encode("ascii")
+
+
+def _probe_result(result: Any) -> Tuple[Callable[[Any], Tuple[Any, Any, Any, Any]], bool]:
+    """
+    Inspect a wrapped call's result and build an extractor for its shape.
+
+    The extractor returns ``(output, tokens_input, tokens_output, model)``.
+    Only the way the output is found is fixed; ``usage`` and ``model`` are
+    looked up on every result. The flag is False when the output shape
+    depends on the value rather than the type (empty ``choices``, or the
+    ``str()`` fallback), so the extractor must not be cached.
+    """
+    cacheable = True
+    if hasattr(result, "choices") and result.choices:
+        # OpenAI response format
+        def get_output(r: Any) -> Any:
+            choice = r.choices[0]
+            return choice.text or choice.message.content
+    elif hasattr(result, "content"):
+        # Anthropic or similar format
+        cacheable = not hasattr(result, "choices")
+        get_output = operator.attrgetter("content")
+    elif isinstance(result, str):
+        def get_output(r: Any) -> Any:
+            return r
+    else:
+        cacheable = False
+        get_output = str
+
+    def extract(r: Any) -> Tuple[Any, Any, Any, Any]:
+        usage = getattr(r, "usage", None)
+        if usage is not None:
+            tokens_input, tokens_output = usage.prompt_tokens, usage.completion_tokens
+        else:
+            tokens_input = tokens_output = None
+        return get_output(r), tokens_input, tokens_output, getattr(r, "model", None)
+
+    return extract, cacheable
+
+
 class RegulateAIError(Exception):
     """Raised when the RegulateAI API returns an error."""
 
@@ -30,34 +143,130 @@ class RegulateAIError(Exception):
         self.status_code = status_code
 
 
+class _HostConnectionPool:
+    """
+    Keeps one persistent keep-alive connection per (scheme, host, port).
+
+    Requests on the same connection are serialized with a lock; a pooled
+    connection the server has closed is re-opened once before giving up.
+    The TLS context (and its CA bundle) is loaded once, not per connection.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._conns: Dict[Tuple[str, str, int], http.client.HTTPConnection] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+    ) -> Tuple[int, str, bytes]:
+        key = (scheme, host, port)
+        with self._lock:
+            reused = key in self._conns
+            try:
+                return self._send(key, method, path, body, headers)
+            except (http.client.RemoteDisconnected, BrokenPipeError):
+                # Only a reused connection the server closed while idle is
+                # retried; anything else may have reached the server already.
+                if not reused:
+                    raise
+                return self._send(key, method, path, body, headers)
+
+    def close(self) -> None:
+        with self._lock:
+            for key in list(self._conns):
+                self._drop(key)
+
+    def _send(
+        self,
+        key: Tuple[str, str, int],
+        method: str,
+        path: str,
+        body: bytes,
+        headers: Dict[str, str],
+    ) -> Tuple[int, str, bytes]:
+        conn = self._conns.get(key)
+        if conn is None:
+            scheme, host, port = key
+            if scheme == "https":
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                conn = http.client.HTTPSConnection(host, port, timeout=self._timeout, context=self._ssl_context)
+            else:
+                conn = http.client.HTTPConnection(host, port, timeout=self._timeout)
+            self._conns[key] = conn
+        try:
+            conn.request(method, path, body, headers)
+            resp = conn.getresponse()
+            return resp.status, resp.getheader("Content-Type", ""), resp.read()
+        except Exception:
+            self._drop(key)
+            raise
+
+    def _drop(self, key: Tuple[str, str, int]) -> None:
+        conn = self._conns.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+
 class LogBuffer:
-    """In-memory buffer for batching logs before sending to API."""
+    """
+    In-memory buffer for batching logs before sending to API.
 
-    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
-        self._buffer: list[Dict[str, Any]] = []
+    Producers append to a deque without taking a lock; only ``flush`` locks,
+    to serialize concurrent drains. Once ``max_size`` entries are waiting,
+    each new entry evicts the oldest one and counts it as dropped.
+    Entries abandoned by a failed flush are counted with ``drop``.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE, max_size: int = DEFAULT_MAX_BUFFERED):
+        self._buffer: Deque[bytes] = collections.deque(maxlen=max_size)
         self._buffer_size = buffer_size
+        self._max_size = max_size
+        self._dropped = 0
         self._lock = threading.Lock()
 
-    def add(self, log_entry: Dict[str, Any]) -> bool:
+    def add(self, log_entry: bytes) -> bool:
         """Add a log entry. Returns True if buffer is full and should be flushed."""
-        with self._lock:
-            self._buffer.append(log_entry)
-            return len(self._buffer) >= self._buffer_size
+        size = len(self._buffer)
+        if size >= self._max_size:
+            self._dropped += 1
+        self._buffer.append(log_entry)
+        return size + 1 >= self._buffer_size
 
-    def flush(self) -> list[Dict[str, Any]]:
-        """Clear and return all buffered entries."""
+    def flush(self) -> list[bytes]:
+        """
+        Remove and return all buffered entries.
+
+        Entries are popped rather than swapping the deque out, so an append
+        racing with the flush lands in the next batch instead of being lost.
+        """
         with self._lock:
-            entries = self._buffer.copy()
-            self._buffer.clear()
-            return entries
+            popleft = self._buffer.popleft
+            return [popleft() for _ in range(len(self._buffer))]
 
     def size(self) -> int:
         """Current buffer size."""
-        with self._lock:
-            return len(self._buffer)
+        return len(self._buffer)
 
     def is_empty(self) -> bool:
-        return self.size() == 0
+        return not self._buffer
+
+    def drop(self, count: int) -> None:
+        """Count entries that were taken out of the buffer but never sent."""
+        self._dropped += count
+
+    def dropped_count(self) -> int:
+        """Number of entries evicted at ``max_size`` or abandoned by a flush."""
+        return self._dropped
 
 
 class ComplianceLogger:
@@ -70,8 +279,17 @@ class ComplianceLogger:
         base_url: Override the API base URL (useful for self-hosting).
         timeout: HTTP request timeout in seconds (default 10).
         silent: If True, suppress warnings on error (default False).
-        buffer_size: Number of logs to buffer before batch sending (default 50).
+        buffer_size: Number of logs to buffer before batch sending (default 50,
+            at most 100). Adjusted at runtime: grows while full batches flush
+            fast, halves on failure.
         flush_interval: Seconds between automatic flushes (default 5).
+        max_buffer_size: Upper bound for the adaptive batch size (default and
+            at most 100, the API's per-batch limit).
+        max_buffered: Most logs held in memory while waiting to be sent
+            (default 10000). Beyond this the oldest logs are dropped.
+        compress: Gzip batch bodies larger than 1 KiB (default True).
+        http2: Send over HTTP/2 using httpx, if installed with its ``http2``
+            extra (default False). Falls back to HTTP/1.1 keep-alive otherwise.
     """
 
     def __init__(
@@ -83,6 +301,10 @@ class ComplianceLogger:
         silent: bool = False,
         buffer_size: int = DEFAULT_BUFFER_SIZE,
         flush_interval: int = DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+        compress: bool = True,
+        http2: bool = False,
     ) -> None:
         if not api_key or not isinstance(api_key, str):
             raise ValueError("[RegulateAI] api_key is required and must be a non-empty string.")
@@ -94,44 +316,179 @@ class ComplianceLogger:
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._silent = silent
-        self._buffer = LogBuffer(buffer_size)
+        self._compress = compress
+
+        url = urllib.parse.urlsplit(self._base_url)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"[RegulateAI] Invalid base_url: {base_url!r}")
+        self._scheme = url.scheme
+        self._host = url.hostname
+        self._port = url.port or (443 if url.scheme == "https" else 80)
+        self._ingest_path = url.path + "/ingest/logs"
+        self._pool = _HostConnectionPool(timeout)
+        self._headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            "x-api-key": self._api_key,
+            "x-project-id": self._project_id,
+            "User-Agent": "regulateai-python-sdk/2.0.0",
+        }
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
+        self._failed_flushes = 0
+        self._network_errors = _NETWORK_ERRORS
+        self._http = self._http2_client() if http2 else None
+
+        buffer_size = max(1, min(buffer_size, MAX_BATCH_SIZE))
+        max_buffer_size = min(max(buffer_size, max_buffer_size), max_buffered, MAX_BATCH_SIZE)
+        # Without a flush interval, wake the sender for every entry.
+        self._buffer = LogBuffer(buffer_size if flush_interval > 0 else 1, max_size=max_buffered)
+        self._batch_size = buffer_size
+        self._reported_dropped = 0
         self._flush_interval = flush_interval
-        self._last_flush = time.time()
-        self._flush_thread: Optional[threading.Thread] = None
+        self._min_buffer_size = min(buffer_size, MIN_BUFFER_SIZE)
+        self._max_buffer_size = max_buffer_size
+        self._rtt_ewma: Optional[float] = None
+        self._fast_flushes = 0
+        self._wake = threading.Event()
         self._running = True
 
-        # Start background flush thread
-        if flush_interval > 0:
-            self._flush_thread = threading.Thread(target=self._background_flush, daemon=True)
-            self._flush_thread.start()
+        # Process-local ids and a per-second cache of the created_at string.
+        self._seq = itertools.count(1)
+        self._created_at: Tuple[int, str] = (0, "")
+
+        # Start background sender thread; log() only ever enqueues.
+        self._flush_thread = threading.Thread(target=self._background_flush, daemon=True)
+        self._flush_thread.start()
+
+    def _http2_client(self) -> Optional[Any]:
+        """Build an HTTP/2 httpx client, or None if httpx/h2 are unavailable."""
+        try:
+            import httpx  # optional, only needed for HTTP/2
+
+            # Rebuild from the netloc: .hostname drops IPv6 brackets.
+            url = urllib.parse.urlsplit(self._base_url)
+            client = httpx.Client(
+                http2=True,
+                base_url=f"{url.scheme}://{url.netloc}",
+                timeout=self._timeout,
+                # Connection-specific headers are not allowed in HTTP/2.
+                headers={k: v for k, v in self._headers.items() if k != "Connection"},
+            )
+        except ImportError as exc:
+            if not self._silent:
+                _logger.warning("[RegulateAI] HTTP/2 unavailable, using HTTP/1.1: %s", exc)
+            return None
+        self._network_errors = _NETWORK_ERRORS + (httpx.HTTPError,)
+        return client
 
     def _background_flush(self) -> None:
-        """Background thread to periodically flush the buffer."""
+        """Background thread sending batches as they fill or flush_interval elapses."""
+        wait = self._flush_interval if self._flush_interval > 0 else None
         while self._running:
-            time.sleep(1)
-            if time.time() - self._last_flush >= self._flush_interval:
+            self._wake.wait(wait)
+            self._wake.clear()
+            try:
                 if not self._buffer.is_empty():
                     self._flush()
-
-    def _should_flush(self) -> bool:
-        """Check if we should flush based on buffer size or time."""
-        return self._buffer.size() >= self._buffer._buffer_size or \
-               (time.time() - self._last_flush) >= self._flush_interval
+                self._report_dropped()
+            except Exception as e:
+                # This thread is the only sender: never let an error kill it.
+                if self._should_report_failure():
+                    _logger.warning(
+                        "[RegulateAI] Background flush failed (failure #%d): %s",
+                        self._failed_flushes, e,
+                    )
+
+    def _should_report_failure(self) -> bool:
+        """
+        Count a failure; True for the 1st, 2nd, 4th, 8th... one of an outage.
+        The count is reset by the next successful send.
+        """
+        self._failed_flushes += 1
+        failures = self._failed_flushes
+        return not self._silent and failures & (failures - 1) == 0
+
+    def _report_dropped(self) -> None:
+        """Warn once per flush cycle if logs were dropped since the last report."""
+        dropped = self._buffer.dropped_count()
+        if dropped != self._reported_dropped:
+            if not self._silent:
+                _logger.warning(
+                    "[RegulateAI] Dropped %d logs (%d in total): buffer full or API unreachable.",
+                    dropped - self._reported_dropped, dropped,
+                )
+            self._reported_dropped = dropped
 
     def _flush(self) -> None:
-        """Flush the buffer to the API."""
-        entries = self._buffer.flush()
-        if not entries:
-            return
+        """
+        Flush the buffer to the API, at most one batch per request.
 
+        Stops at the first failed batch, so an outage costs one request per
+        flush; the entries not yet sent are counted as dropped.
+        """
+        entries = self._buffer.flush()
+        batch_size = max(1, self._batch_size)
+        start = 0
+        while start < len(entries):
+            end = start + batch_size
+            if not self._send(entries[start:end]):
+                self._buffer.drop(max(0, len(entries) - end))
+                return
+            start = end
+
+    def _send(self, entries: list[bytes]) -> bool:
+        """POST a batch of pre-encoded logs; warns and returns False on failure."""
+        body = b'{"logs":[' + b",".join(entries) + b"]}"
+        gzipped = self._compress and len(body) > COMPRESS_MIN_BYTES
+        if gzipped:
+            body = gzip.compress(body, compresslevel=1)
+        full = len(entries) >= self._batch_size
+        start = time.perf_counter()
         try:
-            self._request("POST", "/ingest/logs", {"logs": entries})
+            self._request("POST", self._ingest_path, body, gzipped)
         except RegulateAIError as e:
-            if not self._silent:
-                import warnings
-                warnings.warn(f"[RegulateAI] Failed to flush {len(entries)} logs: {e}", stacklevel=2)
+            self._adapt_buffer_size(None, full)
+            if self._should_report_failure():
+                _logger.warning(
+                    "[RegulateAI] Failed to flush %d logs (failure #%d): %s",
+                    len(entries), self._failed_flushes, e,
+                )
+            return False
+        self._failed_flushes = 0
+        self._adapt_buffer_size(time.perf_counter() - start, full)
+        return True
 
-        self._last_flush = time.time()
+    def _adapt_buffer_size(self, rtt: Optional[float], full: bool) -> None:
+        """
+        AIMD batch sizing from flush round-trip times (None means failure).
+
+        Grows the batch by 25% after a run of full batches that flushed well
+        under flush_interval, and halves it on failure or when flushes take
+        longer than flush_interval. Partial batches sent by the interval
+        timer never count toward growth: there is no backlog to absorb.
+        """
+        if self._flush_interval <= 0:
+            return
+        if rtt is not None:
+            self._rtt_ewma = rtt if self._rtt_ewma is None else 0.8 * self._rtt_ewma + 0.2 * rtt
+            if self._rtt_ewma < self._flush_interval * 0.3:
+                if full:
+                    self._fast_flushes += 1
+                    if self._fast_flushes >= GROW_AFTER_FLUSHES:
+                        self._fast_flushes = 0
+                        size = self._batch_size
+                        self._resize_batch(min(self._max_buffer_size, max(size + 1, int(size * 1.25))))
+                return
+            if self._rtt_ewma <= self._flush_interval:
+                self._fast_flushes = 0
+                return
+        self._fast_flushes = 0
+        self._resize_batch(max(self._min_buffer_size, self._batch_size // 2))
+
+    def _resize_batch(self, size: int) -> None:
+        """Set the per-request batch size and the buffer's flush threshold."""
+        self._batch_size = size
+        self._buffer._buffer_size = size
 
     def log(
         self,
@@ -172,6 +529,7 @@ class ComplianceLogger:
         Raises:
             RegulateAIError: If the API returns an error response.
             ValueError: If required parameters are missing.
+            TypeError: If metadata is not JSON serializable.
         """
         if not prompt or not isinstance(prompt, str):
             raise ValueError("[RegulateAI] log() requires a non-empty string 'prompt'.")
@@ -180,41 +538,21 @@ class ComplianceLogger:
         if not model or not isinstance(model, str):
             raise ValueError("[RegulateAI] log() requires a non-empty string 'model'.")
 
-        payload: Dict[str, Any] = {
-            "prompt": prompt,
-            "output": output,
-            "model": model,
-        }
+        entry = _encode_log(
+            prompt, output, model, model_version, confidence, latency_ms,
+            tokens_input, tokens_output, user_identifier, session_id, framework, metadata,
+        )
+        if self._buffer.add(entry):
+            self._wake.set()
 
-        if model_version is not None:
-            payload["modelVersion"] = model_version
-        if confidence is not None:
-            payload["confidence"] = confidence
-        if latency_ms is not None:
-            payload["latencyMs"] = latency_ms
-        if tokens_input is not None:
-            payload["tokensInput"] = tokens_input
-        if tokens_output is not None:
-            payload["tokensOutput"] = tokens_output
-        if user_identifier is not None:
-            payload["userIdentifier"] = user_identifier
-        if session_id is not None:
-            payload["sessionId"] = session_id
-        if framework is not None:
-            payload["framework"] = framework
-        if metadata is not None:
-            payload["metadata"] = metadata
-
-        # Add to buffer
-        self._buffer.add(payload)
-
-        # Check if we should flush
-        if self._should_flush():
-            self._flush()
+        now = int(time.time())
+        created_at = self._created_at
+        if created_at[0] != now:
+            created_at = self._created_at = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
 
         return {
-            "id": f"local-{int(time.time() * 1000)}",
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "id": f"local-{next(self._seq)}",
+            "created_at": created_at[1],
             "buffered": True,
         }
 
@@ -238,6 +576,9 @@ class ComplianceLogger:
                 return openai.Completion.create(prompt=prompt).choices[0].text
         """
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
+            # Result extractors per result type, probed on first sight.
+            extractors: Dict[type, Callable[[Any], Tuple[Any, Any, Any, Any]]] = {}
+
             def wrapper(*args: Any, **kwargs: Any) -> T:
                 start_time = time.time()
 
@@ -251,33 +592,29 @@ class ComplianceLogger:
                 # Execute the function
                 result = func(*args, **kwargs)
 
-                # Extract output
-                output = None
-                if hasattr(result, "choices") and result.choices:
-                    # OpenAI response format
-                    output = result.choices[0].text or result.choices[0].message.content
-                elif hasattr(result, "content"):
-                    # Anthropic or similar format
-                    output = result.content
-                elif isinstance(result, str):
-                    output = result
-                else:
-                    output = str(result)
+                # Extract output, token counts and model with the extractor
+                # cached for this result type; re-probe if the shape changed.
+                fields = None
+                extract = extractors.get(type(result))
+                if extract is not None:
+                    try:
+                        fields = extract(result)
+                    except (AttributeError, IndexError):
+                        pass
+                if fields is None:
+                    extract, cacheable = _probe_result(result)
+                    if cacheable:
+                        extractors[type(result)] = extract
+                    fields = extract(result)
+                output, tokens_input, tokens_output, result_model = fields
 
                 # Calculate latency
                 latency_ms = int((time.time() - start_time) * 1000)
 
-                # Extract token counts if available
-                tokens_input = None
-                tokens_output = None
-                if hasattr(result, "usage"):
-                    tokens_input = result.usage.prompt_tokens
-                    tokens_output = result.usage.completion_tokens
-
                 # Extract model if not provided
                 actual_model = model
-                if hasattr(result, "model") and not model_version:
-                    actual_model = result.model
+                if result_model is not None and not model_version:
+                    actual_model = result_model
 
                 # Log the interaction
                 self.log(
@@ -300,39 +637,56 @@ class ComplianceLogger:
         """Manually flush all buffered logs."""
         self._flush()
 
+    def dropped_count(self) -> int:
+        """Number of logs dropped because the buffer was full or a flush failed."""
+        return self._buffer.dropped_count()
+
     def close(self) -> None:
-        """Stop background thread and flush remaining logs."""
-        self._running = False
+        """Stop background thread, flush remaining logs and close the connection."""
+        if self._running:
+            self._running = False
+            self._wake.set()
+            # Bounded: a flush stuck on an unreachable API must not hang exit.
+            self._flush_thread.join(self._timeout)
         self.flush()
+        self._pool.close()
+        if self._http is not None:
+            self._http.close()
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
-    def _request(self, method: str, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        data = json.dumps(body).encode("utf-8")
-
-        req = urllib.request.Request(
-            url,
-            data=data,
-            method=method,
-            headers={
-                "Content-Type": "application/json",
-                "x-api-key": self._api_key,
-                "x-project-id": self._project_id,
-                "User-Agent": "regulateai-python-sdk/2.0.0",
-            },
-        )
-
+    def _request(
+        self,
+        method: str,
+        path: str,
+        data: bytes,
+        gzipped: bool = False,
+    ) -> Dict[str, Any]:
         try:
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                raw = resp.read().decode("utf-8")
-                return json.loads(raw) if raw else {}
-        except urllib.error.HTTPError as exc:
-            raw = exc.read().decode("utf-8")
-            try:
-                detail = json.loads(raw).get("error", raw)
-            except Exception:
-                detail = raw
-            raise RegulateAIError(detail, status_code=exc.code) from exc
-        except urllib.error.URLError as exc:
-            raise RegulateAIError(f"Network error: {exc.reason}") from exc
+            if self._http is not None:
+                resp = self._http.request(
+                    method, path, content=data,
+                    headers={"Content-Encoding": "gzip"} if gzipped else None,
+                )
+                status, content_type, raw_bytes = resp.status_code, resp.headers.get("Content-Type", ""), resp.content
+            else:
+                status, content_type, raw_bytes = self._pool.request(
+                    self._scheme, self._host, self._port,
+                    method, path, data, self._gzip_headers if gzipped else self._headers,
+                )
+        except self._network_errors as exc:
+            raise RegulateAIError(f"Network error: {exc}") from exc
+
+        is_json = content_type.startswith("application/json")
+        if status >= 400:
+            detail = raw_bytes.decode("utf-8", "replace")
+            if is_json:
+                try:
+                    detail = json.loads(raw_bytes).get("error", detail)
+                except Exception:
+                    pass
+            raise RegulateAIError(detail, status_code=status)
+        # Ingest acknowledgements are often empty; skip parsing non-JSON bodies.
+        if not raw_bytes or not is_json:
+            return {}
+        return json.loads(raw_bytes)
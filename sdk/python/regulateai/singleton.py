@@ -20,6 +20,10 @@ def init(
     silent: bool = False,
     buffer_size: int = 50,
     flush_interval: int = 5,
+    max_buffer_size: int = 100,
+    max_buffered: int = 10_000,
+    compress: bool = True,
+    http2: bool = False,
 ) -> ComplianceLogger:
     """
     Initialize the global RegulateAI logger instance.
@@ -30,8 +34,15 @@ def init(
         base_url: Override the API base URL (useful for self-hosting).
         timeout: HTTP request timeout in seconds (default 10).
         silent: If True, suppress warnings on error (default False).
-        buffer_size: Number of logs to buffer before batch sending (default 50).
+        buffer_size: Number of logs to buffer before batch sending (default 50,
+            at most 100).
         flush_interval: Seconds between automatic flushes (default 5).
+        max_buffer_size: Upper bound for the adaptive batch size (default and
+            at most 100, the API's per-batch limit).
+        max_buffered: Most logs held in memory while waiting to be sent
+            (default 10000). Beyond this the oldest logs are dropped.
+        compress: Gzip batch bodies larger than 1 KiB (default True).
+        http2: Send over HTTP/2 using httpx, if installed (default False).
 
     Returns:
         The ComplianceLogger instance.
@@ -53,6 +64,10 @@ def init(
         silent=silent,
         buffer_size=buffer_size,
         flush_interval=flush_interval,
+        max_buffer_size=max_buffer_size,
+        max_buffered=max_buffered,
+        compress=compress,
+        http2=http2,
     )
     return _instance
 